@@ -1,6 +1,10 @@
 import customtkinter as ctk
 import mysql.connector
-from datetime import datetime
+from datetime import datetime, timedelta
+import json
+import os
+import mmap
+import struct
 import threading
 import time
 import google.generativeai as genai
@@ -163,6 +167,63 @@ except Exception as e:
     print(f"Error de conexión con la IA: {e}")
     print("Asegúrate de que tu API_KEY sea correcta y que el servicio de IA esté disponible.")
 
+# Política de archivado
+# Los elementos que la cumplen salen de las tablas de trabajo y pasan a la tabla 'archivo',
+# conservando sus totales en 'contadores_archivo'. Usa None para no archivar una entidad.
+ARCHIVO_CONFIG = {
+    'activo': True,
+    'dias_tareas_completadas': 30, # Tareas completadas hace más de N días
+    'dias_recordatorios': 90,
+    'dias_listas': 180,
+    'tamano_lote': 500, # Filas movidas por transacción
+    'limite_consulta': 200 # Máximo de elementos mostrados al explorar el archivo
+}
+
+# Columnas que se guardan de cada entidad y condición que la hace archivable.
+# Los elementos restaurados quedan en 'elementos_fijados' y la política ya no los archiva.
+ENTIDADES_ARCHIVABLES = {
+    'tareas': {
+        'columnas': ['id', 'nombre', 'fecha_creacion', 'completada', 'importancia', 'notas', 'trabajo_id', 'fecha_completada'],
+        'condicion': "completada = 1 AND fecha_completada < %s",
+        'politica': 'dias_tareas_completadas',
+        'etiqueta': 'nombre'
+    },
+    'recordatorios': {
+        'columnas': ['id', 'texto', 'fecha_creacion'],
+        'condicion': "fecha_creacion < %s",
+        'politica': 'dias_recordatorios',
+        'etiqueta': 'texto'
+    },
+    'listas': {
+        'columnas': ['id', 'titulo', 'elementos', 'fecha_creacion'],
+        'condicion': "fecha_creacion < %s",
+        'politica': 'dias_listas',
+        'etiqueta': 'titulo'
+    }
+}
+
+# Instantánea local de la última interfaz pintada, para mostrar datos al instante al arrancar
+# mientras se reconcilia con la base de datos en segundo plano.
+CACHE_DIR = os.path.join(os.environ.get('LOCALAPPDATA') or os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache'), 'asistente')
+SNAPSHOT_PATH = os.path.join(CACHE_DIR, 'snapshot.bin')
+SNAPSHOT_CABECERA = struct.Struct('<4sH') # Firma del archivo y versión del formato
+SNAPSHOT_FIRMA = b'ASNP'
+SNAPSHOT_FORMATO = 4
+SNAPSHOT_ESPERA_MS = 1000 # Agrupa en una sola escritura los cambios seguidos de la interfaz
+
+# Registro de cambios compartido entre instancias: cada instancia sondea solo las filas nuevas
+CAMBIOS_CONFIG = {
+    'intervalo_ms': 3000, # Frecuencia de sondeo del registro
+    'reintento_ms': 15000, # Espera entre intentos mientras la base de datos no responde
+    'limite_lote': 500, # Máximo de cambios aplicados por sondeo; por encima, al arrancar se recarga todo
+    'dias_retencion': 7 # Antigüedad a partir de la cual se depuran las entradas del registro
+}
+# Tablas cuyas modificaciones quedan registradas mediante triggers
+TABLAS_CON_REGISTRO = ['tareas', 'recordatorios', 'listas', 'trabajos']
+
+# Opción de los selectores de proyecto para tareas sin trabajo asignado
+SIN_PROYECTO = "Sin proyecto"
+
 # Temas de estudio enfocados en programación
 TEMAS_DE_ESTUDIO_IA = [
     'Arquitectura de microservicios',
@@ -189,19 +250,145 @@ def crear_tablas():
             # La tabla 'tareas' ahora incluye 'importancia' y 'notas'
             "CREATE TABLE IF NOT EXISTS tareas (id INT AUTO_INCREMENT PRIMARY KEY, nombre VARCHAR(255) NOT NULL, fecha_creacion DATETIME, completada BOOLEAN DEFAULT FALSE, importancia VARCHAR(50) DEFAULT 'Media', notas TEXT)",
             "CREATE TABLE IF NOT EXISTS recordatorios (id INT AUTO_INCREMENT PRIMARY KEY, texto VARCHAR(255) NOT NULL, fecha_creacion DATETIME)",
-            "CREATE TABLE IF NOT EXISTS listas (id INT AUTO_INCREMENT PRIMARY KEY, titulo VARCHAR(255) NOT NULL, elementos TEXT, fecha_creacion DATETIME)"
+            "CREATE TABLE IF NOT EXISTS listas (id INT AUTO_INCREMENT PRIMARY KEY, titulo VARCHAR(255) NOT NULL, elementos TEXT, fecha_creacion DATETIME)",
+            "CREATE TABLE IF NOT EXISTS trabajos (id INT AUTO_INCREMENT PRIMARY KEY, nombre VARCHAR(255) NOT NULL, fecha_hora VARCHAR(255) NOT NULL, fecha_creacion DATETIME NOT NULL)",
+            # Almacén frío: copia JSON de los elementos archivados y totales históricos por entidad
+            "CREATE TABLE IF NOT EXISTS archivo (id INT AUTO_INCREMENT PRIMARY KEY, entidad VARCHAR(20) NOT NULL, id_original INT NOT NULL, datos JSON NOT NULL, fecha_archivado DATETIME NOT NULL, INDEX idx_archivo_entidad_fecha (entidad, fecha_archivado))",
+            "CREATE TABLE IF NOT EXISTS contadores_archivo (entidad VARCHAR(20) PRIMARY KEY, total INT NOT NULL DEFAULT 0, completadas INT NOT NULL DEFAULT 0)",
+            "CREATE TABLE IF NOT EXISTS elementos_fijados (entidad VARCHAR(20) NOT NULL, entidad_id INT NOT NULL, PRIMARY KEY (entidad, entidad_id))",
+            # Registro monótono de cambios: su último 'seq' es la versión de los datos.
+            # 'seq' no es AUTO_INCREMENT: lo reparte la fila bloqueada de 'secuencia_cambios' (ver crear_triggers_registro).
+            "CREATE TABLE IF NOT EXISTS registro_cambios (seq BIGINT PRIMARY KEY, entidad VARCHAR(20) NOT NULL, entidad_id INT NOT NULL, operacion CHAR(1) NOT NULL, fecha DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP)",
+            "CREATE TABLE IF NOT EXISTS secuencia_cambios (id TINYINT PRIMARY KEY, seq BIGINT NOT NULL DEFAULT 0)",
+            "INSERT IGNORE INTO secuencia_cambios (id, seq) SELECT 1, COALESCE(MAX(seq), 0) FROM registro_cambios"
         ]
         for query in queries:
             try:
                 cursor.execute(query)
             except mysql.connector.Error as err:
                 print(f"Error al crear tabla (puede que ya exista): {err}")
+        migrar_columnas(cursor)
+        crear_triggers_registro(cursor)
         conn.commit()
         cursor.close()
         conn.close()
     else:
         print("No se pudo conectar a la base de datos para crear tablas.")
 
+def migrar_columnas(cursor):
+    """Añade a las tablas existentes las columnas que aún no tienen, con sus índices y datos iniciales."""
+    migraciones = [
+        # Fecha en la que se completó la tarea; la política de archivado cuenta desde ella.
+        # Las tareas ya completadas toman su fecha de creación como mejor aproximación.
+        ('tareas', 'fecha_completada', "ALTER TABLE tareas ADD COLUMN fecha_completada DATETIME NULL",
+         ["UPDATE tareas SET fecha_completada = fecha_creacion WHERE completada = 1 AND fecha_completada IS NULL"]),
+        # El índice compuesto sirve a la clave foránea y cubre el conteo de tareas y completadas por trabajo
+        ('tareas', 'trabajo_id', "ALTER TABLE tareas ADD COLUMN trabajo_id INT NULL, ADD INDEX idx_tareas_trabajo (trabajo_id, completada), "
+                                 "ADD CONSTRAINT fk_tareas_trabajo FOREIGN KEY (trabajo_id) REFERENCES trabajos (id) ON DELETE SET NULL", []),
+        # (trabajo_id, entidad) cubre el conteo de tareas archivadas por trabajo sin leer la tabla
+        ('archivo', 'trabajo_id', "ALTER TABLE archivo ADD COLUMN trabajo_id INT NULL, ADD INDEX idx_archivo_trabajo (trabajo_id, entidad)", [])
+    ]
+    try:
+        cursor.execute("SELECT TABLE_NAME, COLUMN_NAME FROM information_schema.COLUMNS WHERE TABLE_SCHEMA = DATABASE()")
+        existentes = set(cursor.fetchall())
+    except mysql.connector.Error as err:
+        print(f"Error al consultar las columnas existentes: {err}")
+        return
+    for tabla, columna, query, posteriores in migraciones:
+        if (tabla, columna) in existentes:
+            continue
+        try:
+            cursor.execute(query)
+            for posterior in posteriores:
+                cursor.execute(posterior)
+        except mysql.connector.Error as err:
+            print(f"Error al añadir '{columna}' a la tabla {tabla}: {err}")
+
+    # Bases creadas cuando idx_archivo_trabajo solo incluía trabajo_id
+    try:
+        cursor.execute("SELECT COUNT(*) FROM information_schema.STATISTICS WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = 'archivo' AND INDEX_NAME = 'idx_archivo_trabajo'")
+        if cursor.fetchone()[0] == 1:
+            cursor.execute("ALTER TABLE archivo DROP INDEX idx_archivo_trabajo, ADD INDEX idx_archivo_trabajo (trabajo_id, entidad)")
+    except mysql.connector.Error as err:
+        print(f"Error al actualizar el índice idx_archivo_trabajo: {err}")
+
+    # Índices que limitan los SELECT ... FOR UPDATE del archivado a las filas que cumplen la política;
+    # sin ellos cada lote recorre y bloquea la tabla completa
+    indices = [
+        ('tareas', 'idx_tareas_archivado', "ALTER TABLE tareas ADD INDEX idx_tareas_archivado (completada, fecha_completada)"),
+        ('recordatorios', 'idx_recordatorios_fecha', "ALTER TABLE recordatorios ADD INDEX idx_recordatorios_fecha (fecha_creacion)"),
+        ('listas', 'idx_listas_fecha', "ALTER TABLE listas ADD INDEX idx_listas_fecha (fecha_creacion)")
+    ]
+    try:
+        cursor.execute("SELECT DISTINCT TABLE_NAME, INDEX_NAME FROM information_schema.STATISTICS WHERE TABLE_SCHEMA = DATABASE()")
+        indices_existentes = set(cursor.fetchall())
+    except mysql.connector.Error as err:
+        print(f"Error al consultar los índices existentes: {err}")
+        return
+    for tabla, indice, query in indices:
+        if (tabla, indice) in indices_existentes:
+            continue
+        try:
+            cursor.execute(query)
+        except mysql.connector.Error as err:
+            print(f"Error al crear el índice {indice} en la tabla {tabla}: {err}")
+
+def crear_triggers_registro(cursor):
+    """Crea los triggers que anotan en 'registro_cambios' cada alta, modificación o baja.
+
+    Al vivir en la base de datos, también registran los cambios hechos por otras instancias o scripts.
+    Cada trigger toma el siguiente 'seq' incrementando la única fila de 'secuencia_cambios', cuyo bloqueo
+    dura hasta el commit. Así ninguna transacción obtiene un 'seq' mayor mientras otra con uno menor
+    sigue abierta, y 'WHERE seq > ultimo_visto' no se salta cambios que se confirman tarde.
+    """
+    try:
+        cursor.execute("SELECT TRIGGER_NAME, ACTION_STATEMENT FROM information_schema.TRIGGERS WHERE TRIGGER_SCHEMA = DATABASE()")
+        existentes = {nombre: cuerpo for nombre, cuerpo in cursor.fetchall()}
+    except mysql.connector.Error as err:
+        print(f"Error al consultar los triggers existentes: {err}")
+        return
+    operaciones = {'INSERT': ('I', 'NEW'), 'UPDATE': ('U', 'NEW'), 'DELETE': ('D', 'OLD')}
+    for tabla in TABLAS_CON_REGISTRO:
+        for evento, (operacion, fila) in operaciones.items():
+            nombre = f"trg_{tabla}_{evento.lower()}_registro"
+            if nombre in existentes and 'secuencia_cambios' in existentes[nombre]:
+                continue
+            try:
+                if nombre in existentes:
+                    # Versión anterior del trigger, que dependía del AUTO_INCREMENT de 'registro_cambios'
+                    cursor.execute(f"DROP TRIGGER {nombre}")
+                cursor.execute(
+                    f"CREATE TRIGGER {nombre} AFTER {evento} ON {tabla} FOR EACH ROW BEGIN "
+                    "UPDATE secuencia_cambios SET seq = seq + 1 WHERE id = 1; "
+                    f"INSERT INTO registro_cambios (seq, entidad, entidad_id, operacion) SELECT seq, '{tabla}', {fila}.id, '{operacion}' FROM secuencia_cambios WHERE id = 1; "
+                    "END"
+                )
+            except mysql.connector.Error as err:
+                print(f"Error al crear el trigger {nombre}: {err}")
+
+def obtener_version_datos():
+    """Devuelve el último 'seq' del registro de cambios, o None si la base de datos no está disponible."""
+    data = obtener_datos_bd("SELECT COALESCE(MAX(seq), 0) FROM registro_cambios")
+    return data[0][0] if data else None
+
+def obtener_seq_minimo():
+    """Devuelve el 'seq' más antiguo que conserva el registro de cambios, o None si está vacío."""
+    data = obtener_datos_bd("SELECT MIN(seq) FROM registro_cambios")
+    return data[0][0] if data else None
+
+def obtener_cambios(desde_seq, limite, conn=None):
+    """Devuelve los cambios posteriores a desde_seq como (seq, entidad, entidad_id, operacion)."""
+    query = "SELECT seq, entidad, entidad_id, operacion FROM registro_cambios WHERE seq > %s ORDER BY seq LIMIT %s"
+    return obtener_datos_bd(query, (desde_seq, limite), conn)
+
+def depurar_registro_cambios():
+    """Elimina las entradas antiguas del registro, conservando siempre la última para no perder la versión."""
+    ultimo_seq = obtener_version_datos()
+    if not ultimo_seq:
+        return False
+    limite_fecha = datetime.now() - timedelta(days=CAMBIOS_CONFIG.get('dias_retencion', 7))
+    return ejecutar_consulta_bd("DELETE FROM registro_cambios WHERE fecha < %s AND seq < %s", (limite_fecha, ultimo_seq))
+
 def ejecutar_consulta_bd(query, values=None):
     """Ejecuta una consulta en la base de datos y maneja errores."""
     conn = conectar_bd()
@@ -223,22 +410,258 @@ def ejecutar_consulta_bd(query, values=None):
             conn.close()
     return False
 
-def obtener_datos_bd(query):
-    """Obtiene datos de la base de datos y maneja errores."""
+def obtener_datos_bd(query, values=None, conn=None):
+    """Obtiene datos de la base de datos y maneja errores.
+
+    Devuelve None si no hay conexión o la consulta falla, para distinguir el error de un resultado vacío.
+    Si se pasa una conexión persistente, se reutiliza sin cerrarla y los errores se propagan
+    para que quien la mantiene decida reconectar.
+    """
+    if conn is not None:
+        cursor = conn.cursor()
+        try:
+            cursor.execute(query, values)
+            return cursor.fetchall()
+        finally:
+            cursor.close()
     conn = conectar_bd()
     if conn:
         cursor = conn.cursor()
         try:
-            cursor.execute(query)
+            cursor.execute(query, values)
             data = cursor.fetchall()
             return data
         except mysql.connector.Error as err:
             print(f"Error al obtener datos: {err}")
-            return []
+            return None
         finally:
             cursor.close()
             conn.close()
-    return []
+    return None
+
+def archivar_elementos_antiguos():
+    """Mueve al archivo los elementos que cumplen la política de ARCHIVO_CONFIG.
+
+    Devuelve un diccionario con el número de elementos archivados por entidad.
+    """
+    resumen = {}
+    if not ARCHIVO_CONFIG.get('activo'):
+        return resumen
+    conn = conectar_bd()
+    if not conn:
+        print("No se pudo conectar a la base de datos para archivar.")
+        return resumen
+
+    cursor = conn.cursor()
+    ahora = datetime.now()
+    lote = ARCHIVO_CONFIG.get('tamano_lote', 500)
+    try:
+        for entidad, definicion in ENTIDADES_ARCHIVABLES.items():
+            dias = ARCHIVO_CONFIG.get(definicion['politica'])
+            if dias is None:
+                continue
+            columnas = definicion['columnas']
+            limite_fecha = ahora - timedelta(days=dias)
+            while True:
+                # Cada lote es una transacción: copia al archivo, borra de la tabla y suma contadores
+                cursor.execute(
+                    f"SELECT {', '.join(columnas)} FROM {entidad} WHERE {definicion['condicion']} "
+                    f"AND NOT EXISTS (SELECT 1 FROM elementos_fijados f WHERE f.entidad = %s AND f.entidad_id = {entidad}.id) "
+                    "ORDER BY id LIMIT %s FOR UPDATE",
+                    (limite_fecha, entidad, lote)
+                )
+                filas = cursor.fetchall()
+                if not filas:
+                    # Libera los bloqueos de la lectura antes de pasar a la siguiente entidad
+                    conn.rollback()
+                    break
+                registros = []
+                for fila in filas:
+                    datos = dict(zip(columnas, fila))
+                    # 'trabajo_id' se copia a su propia columna para contar las tareas archivadas de cada trabajo
+                    registros.append((entidad, fila[0], datos.get('trabajo_id'), json.dumps(datos, default=str), ahora))
+                cursor.executemany("INSERT INTO archivo (entidad, id_original, trabajo_id, datos, fecha_archivado) VALUES (%s, %s, %s, %s, %s)", registros)
+                ids = [fila[0] for fila in filas]
+                marcadores = ", ".join(["%s"] * len(ids))
+                cursor.execute(f"DELETE FROM {entidad} WHERE id IN ({marcadores})", ids)
+                completadas = 0
+                if 'completada' in columnas:
+                    completadas = sum(1 for fila in filas if fila[columnas.index('completada')])
+                cursor.execute(
+                    "INSERT INTO contadores_archivo (entidad, total, completadas) VALUES (%s, %s, %s) "
+                    "ON DUPLICATE KEY UPDATE total = total + VALUES(total), completadas = completadas + VALUES(completadas)",
+                    (entidad, len(filas), completadas)
+                )
+                conn.commit()
+                resumen[entidad] = resumen.get(entidad, 0) + len(filas)
+                if len(filas) < lote:
+                    break
+    except mysql.connector.Error as err:
+        conn.rollback()
+        print(f"Error al archivar elementos: {err}")
+    finally:
+        cursor.close()
+        conn.close()
+    return resumen
+
+def restaurar_elemento_archivado(archivo_id):
+    """Devuelve un elemento archivado a su tabla original y descuenta sus contadores."""
+    conn = conectar_bd()
+    if not conn:
+        return False
+    cursor = conn.cursor()
+    try:
+        cursor.execute("SELECT entidad, datos FROM archivo WHERE id = %s FOR UPDATE", (archivo_id,))
+        fila = cursor.fetchone()
+        if not fila or fila[0] not in ENTIDADES_ARCHIVABLES:
+            return False
+        entidad, datos = fila
+        datos = json.loads(datos)
+        if datos.get('trabajo_id'):
+            # Si el trabajo se eliminó mientras la tarea estaba archivada, se restaura sin trabajo
+            cursor.execute("SELECT id FROM trabajos WHERE id = %s", (datos['trabajo_id'],))
+            if not cursor.fetchone():
+                datos['trabajo_id'] = None
+        columnas = ENTIDADES_ARCHIVABLES[entidad]['columnas']
+        marcadores = ", ".join(["%s"] * len(columnas))
+        cursor.execute(f"INSERT INTO {entidad} ({', '.join(columnas)}) VALUES ({marcadores})", [datos.get(c) for c in columnas])
+        cursor.execute("DELETE FROM archivo WHERE id = %s", (archivo_id,))
+        # Se fija para que la política no lo vuelva a archivar en el próximo arranque
+        cursor.execute("INSERT IGNORE INTO elementos_fijados (entidad, entidad_id) VALUES (%s, %s)", (entidad, datos['id']))
+        cursor.execute(
+            "UPDATE contadores_archivo SET total = GREATEST(total - 1, 0), completadas = GREATEST(completadas - %s, 0) WHERE entidad = %s",
+            (1 if datos.get('completada') else 0, entidad)
+        )
+        conn.commit()
+        return True
+    except (mysql.connector.Error, ValueError) as err:
+        conn.rollback()
+        print(f"Error al restaurar elemento archivado: {err}")
+        return False
+    finally:
+        cursor.close()
+        conn.close()
+
+def obtener_elementos_archivados(entidad):
+    """Devuelve los elementos archivados más recientes de una entidad como (id, id_original, datos, fecha_archivado)."""
+    query = "SELECT id, id_original, datos, fecha_archivado FROM archivo WHERE entidad = %s ORDER BY fecha_archivado DESC, id DESC LIMIT %s"
+    filas = obtener_datos_bd(query, (entidad, ARCHIVO_CONFIG.get('limite_consulta', 200)))
+    elementos = []
+    for archivo_id, id_original, datos, fecha_archivado in filas or []:
+        try:
+            elementos.append((archivo_id, id_original, json.loads(datos), fecha_archivado))
+        except ValueError:
+            print(f"Elemento archivado {archivo_id} con datos no válidos, se omite.")
+    return elementos
+
+def obtener_contadores_archivo():
+    """Devuelve los totales históricos archivados por entidad: {entidad: (total, completadas)}."""
+    return {entidad: (total, completadas) for entidad, total, completadas in obtener_datos_bd("SELECT entidad, total, completadas FROM contadores_archivo") or []}
+
+def _codificar_fecha(valor):
+    """Convierte las fechas a un objeto JSON reconocible al leer la instantánea."""
+    if isinstance(valor, datetime):
+        return {'$fecha': valor.isoformat()}
+    raise TypeError(f"Tipo no admitido en la instantánea: {type(valor).__name__}")
+
+def _decodificar_fecha(objeto):
+    if len(objeto) == 1 and '$fecha' in objeto:
+        return datetime.fromisoformat(objeto['$fecha'])
+    return objeto
+
+def cargar_snapshot():
+    """Lee la instantánea local mapeándola en memoria. Devuelve un diccionario o None si no es válida.
+
+    El contenido es JSON (solo enteros, textos y fechas), de modo que un archivo manipulado
+    en la carpeta de caché no puede ejecutar código al cargarse.
+    """
+    try:
+        with open(SNAPSHOT_PATH, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapa:
+            if len(mapa) < SNAPSHOT_CABECERA.size:
+                return None
+            firma, formato = SNAPSHOT_CABECERA.unpack_from(mapa)
+            if firma != SNAPSHOT_FIRMA or formato != SNAPSHOT_FORMATO:
+                return None
+            return json.loads(mapa[SNAPSHOT_CABECERA.size:], object_hook=_decodificar_fecha)
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError) as e:
+        print(f"Instantánea local no válida, se ignora: {e}")
+        return None
+
+def guardar_snapshot(datos):
+    """Escribe la instantánea local de forma atómica (archivo temporal + reemplazo)."""
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        temporal = SNAPSHOT_PATH + '.tmp'
+        with open(temporal, 'wb') as f:
+            f.write(SNAPSHOT_CABECERA.pack(SNAPSHOT_FIRMA, SNAPSHOT_FORMATO))
+            f.write(json.dumps(datos, default=_codificar_fecha, separators=(',', ':')).encode('utf-8'))
+        os.replace(temporal, SNAPSHOT_PATH)
+    except (OSError, TypeError) as e:
+        print(f"No se pudo guardar la instantánea local: {e}")
+
+def advertir_sin_conexion_bd():
+    """Muestra en consola la advertencia de base de datos no disponible."""
+    print("\n--- ADVERTENCIA CRÍTICA ---")
+    print("No se pudo establecer conexión con la base de datos MySQL.")
+    print(f"Por favor, verifica la configuración en DB_CONFIG (host, user, password, database).")
+    print(f"Asegúrate de que el servidor MySQL esté corriendo y la base de datos '{DB_CONFIG.get('database')}' exista.")
+    print("El programa continuará, pero las funcionalidades de tareas y listas no funcionarán.")
+    print("----------------------------\n")
+
+def obtener_progreso_trabajos(ids=None, conn=None):
+    """Devuelve {trabajo_id: (total, completadas)} sumando las tareas activas y las archivadas.
+
+    Si se indican ids, solo se cuentan esos trabajos (los que no tienen tareas quedan a (0, 0)).
+    Ambos conteos se resuelven solo con los índices idx_tareas_trabajo e idx_archivo_trabajo.
+    Las tareas archivadas siempre están completadas, según la política de ARCHIVO_CONFIG.
+    Devuelve None si alguna de las consultas falla.
+    """
+    if ids:
+        filtro = f"trabajo_id IN ({', '.join(['%s'] * len(ids))})"
+        values = tuple(ids)
+        progreso = {trabajo_id: (0, 0) for trabajo_id in ids}
+    else:
+        filtro = "trabajo_id IS NOT NULL"
+        values = None
+        progreso = {}
+    activas = obtener_datos_bd(f"SELECT trabajo_id, COUNT(*), COALESCE(SUM(completada), 0) FROM tareas WHERE {filtro} GROUP BY trabajo_id", values, conn)
+    if activas is None:
+        return None
+    for trabajo_id, total, completadas in activas:
+        progreso[trabajo_id] = (int(total), int(completadas))
+    archivadas = obtener_datos_bd(f"SELECT trabajo_id, COUNT(*) FROM archivo WHERE {filtro} AND entidad = 'tareas' GROUP BY trabajo_id", values, conn)
+    if archivadas is None:
+        return None
+    for trabajo_id, total in archivadas:
+        total_activas, completadas_activas = progreso.get(trabajo_id, (0, 0))
+        progreso[trabajo_id] = (total_activas + int(total), completadas_activas + int(total))
+    return progreso
+
+def eliminar_trabajo(trabajo_id):
+    """Elimina un trabajo dejando sin proyecto a sus tareas, activas y archivadas.
+
+    Las tareas se desvinculan con un UPDATE explícito antes del DELETE: MySQL no dispara triggers
+    en las acciones en cascada de la clave foránea, y sin él otras instancias no verían el cambio.
+    """
+    conn = conectar_bd()
+    if not conn:
+        return False
+    cursor = conn.cursor()
+    try:
+        cursor.execute("UPDATE tareas SET trabajo_id = NULL WHERE trabajo_id = %s", (trabajo_id,))
+        cursor.execute("UPDATE archivo SET trabajo_id = NULL WHERE trabajo_id = %s", (trabajo_id,))
+        cursor.execute("DELETE FROM trabajos WHERE id = %s", (trabajo_id,))
+        conn.commit()
+        return True
+    except mysql.connector.Error as err:
+        conn.rollback()
+        print(f"Error al eliminar el trabajo: {err}")
+        return False
+    finally:
+        cursor.close()
+        conn.close()
 
 def obtener_tema_ia():
     """Genera un tema de estudio usando la IA o la lista predefinida."""
@@ -256,19 +679,26 @@ def obtener_tema_ia():
 
 def analizar_datos_con_ia():
     """Obtiene datos de la BD y los envía a la IA para su análisis."""
-    recordatorios_db = obtener_datos_bd("SELECT texto FROM recordatorios")
-    listas_db = obtener_datos_bd("SELECT titulo FROM listas")
-    tareas_db = obtener_datos_bd("SELECT id, nombre, completada, importancia, notas, fecha_creacion FROM tareas")
+    recordatorios_db = obtener_datos_bd("SELECT texto FROM recordatorios") or []
+    listas_db = obtener_datos_bd("SELECT titulo FROM listas") or []
+    tareas_db = obtener_datos_bd("SELECT id, nombre, completada, importancia, notas, fecha_creacion FROM tareas") or []
 
     recordatorios_str = [r[0] for r in recordatorios_db if r[0]]
     listas_str = [l[0] for l in listas_db if l[0]]
     tareas_str = [f"{t[1]} (Importancia: {t[3]}, Completada: {t[2]}, Notas: {t[4][:50]}...)" for t in tareas_db if t[1]] # Limita notas a 50 chars
 
+    # Del historial archivado solo se envían los totales, no los elementos
+    contadores = obtener_contadores_archivo()
+    tareas_archivadas, completadas_archivadas = contadores.get('tareas', (0, 0))
+    recordatorios_archivados = contadores.get('recordatorios', (0, 0))[0]
+    listas_archivadas = contadores.get('listas', (0, 0))[0]
+
     prompt = f"""
     Analiza mi actividad de programación basada en los siguientes datos:
     - Recordatorios ({len(recordatorios_str)}): {recordatorios_str if recordatorios_str else 'Ninguno'}
     - Listas ({len(listas_str)}): {listas_str if listas_str else 'Ninguna'}
     - Tareas ({len(tareas_str)}): {tareas_str if tareas_str else 'Ninguna'}
+    - Historial archivado: {tareas_archivadas} tareas ({completadas_archivadas} completadas), {recordatorios_archivados} recordatorios, {listas_archivadas} listas
 
     Dame un resumen conciso de mi progreso, identifica posibles áreas de mejora o patrones de productividad, y ofrece 1-2 consejos prácticos y profesionales. Prioriza la acción y la eficiencia.
     """
@@ -295,12 +725,29 @@ class App(ctk.CTk):
         self.geometry("1000x800")
         self.config_gui_style() # Configuración de estilos en un método separado
 
-        crear_tablas() # Asegura que las tablas existan al iniciar
-
         self.create_widgets()
         self.show_panel("Dashboard")
 
         self.current_task_importance = "Media" # Valor por defecto para la creación de tareas
+        self.current_task_project = None # Trabajo al que se asigna la nueva tarea
+
+        # Estado mostrado en la interfaz; se persiste en la instantánea local
+        self.tasks = []
+        self.lists = []
+        self.projects = []
+        self.project_progress = {} # Agregados por trabajo; se recalculan solo cuando cambian tareas o trabajos
+        self.study_topic = None
+        self.data_version = None # Último 'seq' del registro de cambios aplicado al estado
+        self._snapshot_after_id = None
+        self._snapshot_lock = threading.Lock()
+        self._sync_requested = threading.Event() # Despierta al hilo de sincronización antes de su intervalo
+        self._closing = False # Indica al hilo de sincronización que la ventana se está cerrando
+        self.protocol("WM_DELETE_WINDOW", self._on_close)
+
+        # Primero se pinta la última instantánea y después se reconcilia con la BD sin bloquear la interfaz.
+        # El hilo de sincronización vive mientras la aplicación, por eso es 'daemon'.
+        self.load_snapshot()
+        threading.Thread(target=self._sync_in_background, daemon=True).start()
 
     def config_gui_style(self):
         """Configura los estilos y colores globales de la aplicación."""
@@ -318,7 +765,7 @@ class App(ctk.CTk):
         # Panel de navegación (Sidebar)
         self.sidebar = ctk.CTkFrame(self, width=180, corner_radius=0, fg_color=COLOR_SECONDARY_DARK)
         self.sidebar.grid(row=0, column=0, sticky="nsew")
-        self.sidebar.grid_rowconfigure(4, weight=1)
+        self.sidebar.grid_rowconfigure(6, weight=1)
         
         ctk.CTkLabel(self.sidebar, text="Menú Principal", font=ctk.CTkFont(size=20, weight="bold"), text_color=COLOR_TEXT_LIGHT).grid(row=0, column=0, padx=20, pady=20)
         
@@ -329,8 +776,10 @@ class App(ctk.CTk):
         ctk.CTkButton(self.sidebar, text="Panel Principal", command=lambda: self.show_panel("Dashboard"), **button_args).grid(row=1, column=0, padx=20, pady=10)
         ctk.CTkButton(self.sidebar, text="Mis Tareas", command=lambda: self.show_panel("Tasks"), **button_args).grid(row=2, column=0, padx=20, pady=10)
         ctk.CTkButton(self.sidebar, text="Mis Listas", command=lambda: self.show_panel("Lists"), **button_args).grid(row=3, column=0, padx=20, pady=10)
-        ctk.CTkButton(self.sidebar, text="Análisis IA", command=lambda: self.show_panel("AI_Analysis"), **button_args).grid(row=4, column=0, padx=20, pady=10)
-        ctk.CTkButton(self.sidebar, text="Configuración", command=lambda: self.show_panel("Settings"), **button_args).grid(row=6, column=0, padx=20, pady=(10, 40))
+        ctk.CTkButton(self.sidebar, text="Mis Proyectos", command=lambda: self.show_panel("Projects"), **button_args).grid(row=4, column=0, padx=20, pady=10)
+        ctk.CTkButton(self.sidebar, text="Análisis IA", command=lambda: self.show_panel("AI_Analysis"), **button_args).grid(row=5, column=0, padx=20, pady=10)
+        ctk.CTkButton(self.sidebar, text="Archivo", command=lambda: self.show_panel("Archive"), **button_args).grid(row=6, column=0, padx=20, pady=10)
+        ctk.CTkButton(self.sidebar, text="Configuración", command=lambda: self.show_panel("Settings"), **button_args).grid(row=7, column=0, padx=20, pady=(10, 40))
 
         # Contenedor principal para los paneles
         self.main_container = ctk.CTkFrame(self, fg_color=COLOR_PRIMARY_DARK)
@@ -342,7 +791,9 @@ class App(ctk.CTk):
         self.create_dashboard_panel()
         self.create_tasks_panel()
         self.create_lists_panel()
+        self.create_projects_panel()
         self.create_ai_analysis_panel()
+        self.create_archive_panel()
         self.create_settings_panel()
 
         self.current_panel = None
@@ -354,12 +805,252 @@ class App(ctk.CTk):
         self.current_panel = self.panels[name]
         self.current_panel.grid(row=0, column=0, sticky="nsew")
 
+        # Los paneles de datos muestran el estado en memoria; el hilo de sincronización lo mantiene al día
         if name == "Tasks":
-            self.load_tasks()
+            self.render_tasks(self.tasks)
         elif name == "Lists":
-            self.load_lists()
+            self.render_lists(self.lists)
+        elif name == "Projects":
+            self.render_projects(self.projects)
         elif name == "AI_Analysis":
             self.ai_analysis_text.delete("1.0", "end")
+        elif name == "Archive":
+            self.load_archive()
+
+    # --- Arranque e instantánea local ---
+
+    def load_snapshot(self):
+        """Pinta tareas, listas y el tema del día desde la instantánea local, si existe."""
+        snapshot = cargar_snapshot()
+        if not snapshot:
+            return
+        self.tasks = [tuple(row) for row in snapshot.get('tareas', [])]
+        self.lists = [tuple(row) for row in snapshot.get('listas', [])]
+        self.projects = [tuple(row) for row in snapshot.get('trabajos', [])]
+        self.project_progress = {project_id: (total, completed) for project_id, total, completed in snapshot.get('progreso_trabajos', [])}
+        self.study_topic = snapshot.get('tema_estudio')
+        self.data_version = snapshot.get('version')
+        self.render_projects(self.projects)
+        self.render_tasks(self.tasks)
+        self.render_lists(self.lists)
+        if self.study_topic:
+            self.study_topic_label.configure(text=f"✨ Tema del día: {self.study_topic}", text_color=COLOR_ACCENT)
+
+    def save_snapshot(self):
+        """Programa la escritura de la instantánea; varias llamadas seguidas producen una sola escritura."""
+        if self._snapshot_after_id:
+            self.after_cancel(self._snapshot_after_id)
+        self._snapshot_after_id = self.after(SNAPSHOT_ESPERA_MS, self._flush_snapshot)
+
+    def _flush_snapshot(self):
+        self._snapshot_after_id = None
+        # Codificar y escribir miles de filas no debe bloquear la interfaz
+        threading.Thread(target=self._write_snapshot).start()
+
+    def _write_snapshot(self):
+        # El estado se lee al escribir y bajo el candado, así la última escritura siempre es la más reciente.
+        # Las listas se sustituyen (no se modifican) en el hilo de la interfaz, por lo que leerlas aquí es seguro.
+        with self._snapshot_lock:
+            guardar_snapshot({
+                'version': self.data_version,
+                'tareas': self.tasks,
+                'listas': self.lists,
+                'trabajos': self.projects,
+                'progreso_trabajos': [[project_id, total, completed] for project_id, (total, completed) in self.project_progress.items()],
+                'tema_estudio': self.study_topic
+            })
+
+    def _on_close(self):
+        """Escribe la instantánea pendiente antes de cerrar la ventana."""
+        self._closing = True
+        self._sync_requested.set()
+        if self._snapshot_after_id:
+            self.after_cancel(self._snapshot_after_id)
+            self._snapshot_after_id = None
+            self._write_snapshot()
+        self.destroy()
+
+    def _sync_in_background(self):
+        """Hilo único de sincronización con la base de datos.
+
+        Primero prepara las tablas y reconcilia la instantánea; si MySQL no responde, lo reintenta
+        periódicamente. Después sondea el registro de cambios con una conexión persistente.
+        Cualquier error inesperado se registra y el ciclo continúa; solo termina al cerrar la ventana.
+        """
+        since_seq = None
+        conn = None
+        warned = False
+        while not self._closing:
+            try:
+                if since_seq is None:
+                    since_seq = self._startup_sync()
+                    if since_seq is None:
+                        if not warned:
+                            advertir_sin_conexion_bd()
+                            warned = True
+                        self._wait_for_sync(CAMBIOS_CONFIG['reintento_ms'])
+                        continue
+                conn, since_seq = self._poll_changes(conn, since_seq)
+            except Exception as e:
+                if self._closing:
+                    break # self.after falla una vez destruida la ventana
+                print(f"Error inesperado en la sincronización, se reintentará: {e}")
+                # El 'seq' no avanzó: el siguiente sondeo vuelve a leer los mismos cambios con una conexión nueva
+                if conn is not None:
+                    try:
+                        conn.close()
+                    except mysql.connector.Error:
+                        pass
+                conn = None
+            self._wait_for_sync(CAMBIOS_CONFIG['intervalo_ms'])
+        if conn is not None:
+            try:
+                conn.close()
+            except mysql.connector.Error:
+                pass
+
+    def _wait_for_sync(self, timeout_ms):
+        # Espera el intervalo o hasta que request_sync pida un sondeo inmediato
+        self._sync_requested.wait(timeout_ms / 1000)
+        self._sync_requested.clear()
+
+    def request_sync(self):
+        """Pide un sondeo inmediato del registro de cambios, p. ej. tras una modificación local.
+
+        Así el estado en memoria y la instantánea solo se actualizan con datos ligados a un 'seq'.
+        """
+        self._sync_requested.set()
+
+    def _startup_sync(self):
+        """Prepara la BD y reconcilia el estado pintado. Devuelve el 'seq' alcanzado, o None si la BD no está disponible."""
+        if obtener_datos_bd("SELECT 1") is None:
+            return None
+        crear_tablas() # Asegura que las tablas existan al iniciar
+
+        # Mantiene pequeñas las tablas de trabajo antes de leerlas
+        resumen = archivar_elementos_antiguos()
+        if resumen:
+            total = sum(resumen.values())
+            self.after(0, lambda: self.set_notification(f"🗄️ {total} elementos antiguos movidos al archivo.", COLOR_TEXT_MEDIUM))
+
+        depurar_registro_cambios()
+
+        version = obtener_version_datos()
+        if version is None:
+            return None
+        if version == self.data_version:
+            return version
+        if self._can_sync_by_deltas(version):
+            # La instantánea está poco desfasada: el primer sondeo aplica los cambios pendientes
+            return self.data_version
+        # La versión se lee antes que los datos: los cambios intermedios se vuelven a aplicar al sondear
+        tasks = self._fetch_tasks()
+        lists = self._fetch_lists()
+        projects = self._fetch_projects()
+        progress = obtener_progreso_trabajos()
+        if tasks is None or lists is None or projects is None or progress is None:
+            # Un fallo a medias no debe sustituir el estado pintado ni la instantánea por datos vacíos
+            return None
+        self.after(0, lambda: self._apply_db_state(version, tasks, lists, projects, progress))
+        return version
+
+    def _can_sync_by_deltas(self, version):
+        """Indica si el registro de cambios aún contiene todo lo ocurrido desde la versión de la instantánea."""
+        if self.data_version is None or self.data_version > version:
+            return False
+        if version - self.data_version > CAMBIOS_CONFIG['limite_lote']:
+            return False
+        seq_minimo = obtener_seq_minimo()
+        return seq_minimo is None or self.data_version >= seq_minimo - 1
+
+    def _apply_db_state(self, version, tasks, lists, projects, progress):
+        self.data_version = version
+        self.tasks = tasks
+        self.lists = lists
+        self.projects = projects
+        self.project_progress = progress
+        self.render_projects(projects)
+        self.render_tasks(tasks)
+        self.render_lists(lists)
+        self.save_snapshot()
+
+    # --- Sincronización entre instancias ---
+
+    def _poll_changes(self, conn, since_seq):
+        """Aplica los cambios posteriores a since_seq. Devuelve (conexión persistente, último seq aplicado)."""
+        try:
+            if conn is None:
+                conn = conectar_bd()
+                if conn is None:
+                    return None, since_seq
+                conn.autocommit = True # Sin transacción abierta, cada sondeo ve los cambios ya confirmados
+            # Una única consulta indexada por intervalo; solo se leen filas si hubo cambios
+            changes = obtener_cambios(since_seq, CAMBIOS_CONFIG['limite_lote'], conn)
+            if not changes:
+                return conn, since_seq
+            last_seq, deltas = self._fetch_deltas(changes, conn)
+        except mysql.connector.Error as err:
+            print(f"Error al sondear el registro de cambios, se reconectará: {err}")
+            try:
+                conn.close()
+            except mysql.connector.Error:
+                pass
+            return None, since_seq
+        self.after(0, lambda: self._apply_deltas(last_seq, deltas))
+        return conn, last_seq
+
+    def _fetch_deltas(self, changes, conn):
+        """Lee solo las filas afectadas por los cambios. Devuelve (último seq, {entidad: (ids, filas)})."""
+        if not changes:
+            return self.data_version, {}
+        changed_ids = {}
+        for _, entidad, entidad_id, _ in changes:
+            changed_ids.setdefault(entidad, set()).add(entidad_id)
+
+        deltas = {}
+        affected_projects = set(changed_ids.get('trabajos', ()))
+        if 'tareas' in changed_ids:
+            deltas['tareas'] = (changed_ids['tareas'], self._fetch_tasks(changed_ids['tareas'], conn))
+            # Trabajos afectados: el anterior de cada tarea cambiada (según la caché) y el actual
+            affected_projects.update(task[6] for task in self.tasks if task[0] in changed_ids['tareas'])
+            affected_projects.update(task[6] for task in deltas['tareas'][1])
+        if 'listas' in changed_ids:
+            deltas['listas'] = (changed_ids['listas'], self._fetch_lists(changed_ids['listas'], conn))
+        if 'trabajos' in changed_ids:
+            deltas['trabajos'] = (changed_ids['trabajos'], self._fetch_projects(changed_ids['trabajos'], conn))
+        affected_projects.discard(None)
+        if affected_projects:
+            # Solo se recalculan los agregados de esos trabajos; el resto sigue en caché
+            deltas['progreso'] = obtener_progreso_trabajos(affected_projects, conn)
+        return changes[-1][0], deltas
+
+    def _apply_deltas(self, last_seq, deltas):
+        """Sustituye o elimina en memoria las filas cambiadas y vuelve a pintar solo los paneles afectados."""
+        if 'trabajos' in deltas:
+            self.projects = self._merge_rows(self.projects, *deltas['trabajos'], sort_index=3)
+        if 'progreso' in deltas or 'trabajos' in deltas:
+            # Se descartan los agregados de los trabajos eliminados
+            project_ids = {project[0] for project in self.projects}
+            merged_progress = {**self.project_progress, **deltas.get('progreso', {})}
+            self.project_progress = {project_id: progress for project_id, progress in merged_progress.items() if project_id in project_ids}
+            self.render_projects(self.projects)
+        if 'tareas' in deltas:
+            self.tasks = self._merge_rows(self.tasks, *deltas['tareas'], sort_index=5)
+        if 'tareas' in deltas or 'trabajos' in deltas:
+            # Las tareas muestran el nombre de su trabajo, así que también se repintan si cambian los trabajos
+            self.render_tasks(self.tasks)
+        if 'listas' in deltas:
+            self.lists = self._merge_rows(self.lists, *deltas['listas'], sort_index=3)
+            self.render_lists(self.lists)
+        self.data_version = last_seq
+        self.save_snapshot()
+
+    @staticmethod
+    def _merge_rows(rows, changed_ids, fresh_rows, sort_index):
+        # Las filas cambiadas que ya no existen en la BD (borradas o archivadas) desaparecen
+        merged = [row for row in rows if row[0] not in changed_ids] + list(fresh_rows)
+        merged.sort(key=lambda row: row[sort_index] or datetime.min, reverse=True)
+        return merged
 
     def create_dashboard_panel(self):
         panel = ctk.CTkFrame(self.main_container, fg_color=COLOR_PRIMARY_DARK)
@@ -385,6 +1076,14 @@ class App(ctk.CTk):
         self.task_importance_menu.set("Media")
         self.task_importance_menu.pack(side="left", fill="x", expand=True)
 
+        # Selector del trabajo o proyecto al que pertenece la tarea
+        project_frame = ctk.CTkFrame(add_task_frame, fg_color="transparent")
+        project_frame.pack(fill="x", padx=20, pady=(0,10))
+        ctk.CTkLabel(project_frame, text="Proyecto:", text_color=COLOR_TEXT_LIGHT, font=ctk.CTkFont(size=13, weight="normal")).pack(side="left", padx=(0, 10))
+        self.task_project_menu = ctk.CTkOptionMenu(project_frame, values=[SIN_PROYECTO], command=self.set_task_project, fg_color=COLOR_PRIMARY_DARK, button_color=COLOR_ACCENT, button_hover_color="#4A90D9", text_color=COLOR_TEXT_LIGHT)
+        self.task_project_menu.set(SIN_PROYECTO)
+        self.task_project_menu.pack(side="left", fill="x", expand=True)
+
         # Área para notas/proceso de la tarea
         # Se usa 'normal' para un texto descriptivo
         notes_label = ctk.CTkLabel(add_task_frame, text="Notas / Proceso:", text_color=COLOR_TEXT_LIGHT, font=ctk.CTkFont(size=13, weight="normal"))
@@ -450,6 +1149,30 @@ class App(ctk.CTk):
         self.lists_scrollable_frame = ctk.CTkScrollableFrame(panel, fg_color=COLOR_SECONDARY_DARK, corner_radius=10)
         self.lists_scrollable_frame.pack(fill="both", expand=True, padx=30, pady=10)
 
+    def create_projects_panel(self):
+        panel = ctk.CTkFrame(self.main_container, fg_color=COLOR_PRIMARY_DARK)
+        self.panels["Projects"] = panel
+
+        ctk.CTkLabel(panel, text="Mis Proyectos", font=ctk.CTkFont(size=28, weight="bold"), text_color=COLOR_TEXT_LIGHT).pack(pady=(20, 30))
+
+        # Frame para añadir nuevos proyectos
+        add_project_frame = ctk.CTkFrame(panel, fg_color=COLOR_SECONDARY_DARK, corner_radius=10)
+        add_project_frame.pack(fill="x", pady=15, padx=30, ipady=15)
+
+        ctk.CTkLabel(add_project_frame, text="Crear Nuevo Proyecto", font=ctk.CTkFont(size=18, weight="bold"), text_color=COLOR_TEXT_LIGHT).pack(pady=10)
+
+        self.project_name_entry = ctk.CTkEntry(add_project_frame, placeholder_text="Nombre del proyecto", fg_color=COLOR_PRIMARY_DARK, text_color=COLOR_TEXT_LIGHT, border_color=COLOR_BORDER, height=35)
+        self.project_name_entry.pack(fill="x", padx=20, pady=(5,10))
+
+        self.project_date_entry = ctk.CTkEntry(add_project_frame, placeholder_text="Fecha y hora de entrega (dd/mm/aaaa hh:mm)", fg_color=COLOR_PRIMARY_DARK, text_color=COLOR_TEXT_LIGHT, border_color=COLOR_BORDER, height=35)
+        self.project_date_entry.pack(fill="x", padx=20, pady=(0,10))
+
+        ctk.CTkButton(add_project_frame, text="Crear Proyecto", command=self.add_project, fg_color=COLOR_ACCENT, hover_color="#4A90D9", text_color=COLOR_TEXT_LIGHT, height=40).pack(pady=(10,5))
+
+        # Scrollable Frame para mostrar los proyectos con su progreso
+        self.projects_scrollable_frame = ctk.CTkScrollableFrame(panel, fg_color=COLOR_SECONDARY_DARK, corner_radius=10)
+        self.projects_scrollable_frame.pack(fill="both", expand=True, padx=30, pady=10)
+
     def create_ai_analysis_panel(self):
         panel = ctk.CTkFrame(self.main_container, fg_color=COLOR_PRIMARY_DARK)
         self.panels["AI_Analysis"] = panel
@@ -460,6 +1183,28 @@ class App(ctk.CTk):
         self.ai_analysis_text = ctk.CTkTextbox(panel, height=500, width=800, wrap="word", fg_color=COLOR_SECONDARY_DARK, text_color=COLOR_TEXT_LIGHT, border_color=COLOR_BORDER, corner_radius=10)
         self.ai_analysis_text.pack(pady=10, padx=30, fill="both", expand=True)
 
+    def create_archive_panel(self):
+        panel = ctk.CTkFrame(self.main_container, fg_color=COLOR_PRIMARY_DARK)
+        self.panels["Archive"] = panel
+
+        ctk.CTkLabel(panel, text="Archivo", font=ctk.CTkFont(size=28, weight="bold"), text_color=COLOR_TEXT_LIGHT).pack(pady=(20, 30))
+
+        # Selector de entidad y acción de archivado manual
+        archive_controls_frame = ctk.CTkFrame(panel, fg_color="transparent")
+        archive_controls_frame.pack(fill="x", padx=30, pady=(0, 10))
+        self.archive_entity_menu = ctk.CTkOptionMenu(archive_controls_frame, values=["Tareas", "Recordatorios", "Listas"], command=lambda _: self.load_archive(), fg_color=COLOR_PRIMARY_DARK, button_color=COLOR_ACCENT, button_hover_color="#4A90D9", text_color=COLOR_TEXT_LIGHT)
+        self.archive_entity_menu.set("Tareas")
+        self.archive_entity_menu.pack(side="left")
+        ctk.CTkButton(archive_controls_frame, text="Archivar Ahora", command=self.archive_now, fg_color=COLOR_ACCENT, hover_color="#4A90D9", text_color=COLOR_TEXT_LIGHT, height=35).pack(side="right")
+
+        # Totales históricos que se conservan aunque los elementos salgan de las tablas de trabajo
+        self.archive_counters_label = ctk.CTkLabel(panel, text="", justify="left", text_color=COLOR_TEXT_MEDIUM)
+        self.archive_counters_label.pack(anchor="w", padx=30, pady=(0, 5))
+
+        # Scrollable Frame para los elementos archivados
+        self.archive_scrollable_frame = ctk.CTkScrollableFrame(panel, fg_color=COLOR_SECONDARY_DARK, corner_radius=10)
+        self.archive_scrollable_frame.pack(fill="both", expand=True, padx=30, pady=10)
+
     def create_settings_panel(self):
         panel = ctk.CTkFrame(self.main_container, fg_color=COLOR_PRIMARY_DARK)
         self.panels["Settings"] = panel
@@ -485,6 +1230,9 @@ class App(ctk.CTk):
     def set_task_importance(self, importance):
         self.current_task_importance = importance
 
+    def set_task_project(self, label):
+        self.current_task_project = self._project_options().get(label)
+
     def add_task(self):
         task_name = self.task_entry.get().strip()
         task_notes = self.task_notes_entry.get("1.0", "end-1c").strip()
@@ -494,30 +1242,34 @@ class App(ctk.CTk):
             self.set_notification("❌ El nombre de la tarea está vacío.", COLOR_ERROR)
             return
 
-        query = "INSERT INTO tareas (nombre, fecha_creacion, importancia, notas) VALUES (%s, %s, %s, %s)"
-        if ejecutar_consulta_bd(query, (task_name, datetime.now(), importance, task_notes)):
+        query = "INSERT INTO tareas (nombre, fecha_creacion, importancia, notas, trabajo_id) VALUES (%s, %s, %s, %s, %s)"
+        if ejecutar_consulta_bd(query, (task_name, datetime.now(), importance, task_notes, self.current_task_project)):
             self.set_notification(f"✅ Tarea añadida: '{task_name}'", COLOR_SUCCESS)
             self.task_entry.delete(0, "end")
             self.task_notes_entry.set_text("") # Usa set_text para manejar el placeholder
             self.task_importance_menu.set("Media")
             self.current_task_importance = "Media"
-            self.load_tasks() # Recarga la lista de tareas
+            self.request_sync() # El sondeo trae la tarea nueva desde el registro de cambios
         else:
             self.set_notification("❌ Error al añadir la tarea. Revisa la consola para más detalles.", COLOR_ERROR)
 
-    def load_tasks(self):
+    def _fetch_tasks(self, ids=None, conn=None):
+        query = "SELECT id, nombre, completada, importancia, notas, fecha_creacion, trabajo_id FROM tareas"
+        if ids:
+            return obtener_datos_bd(f"{query} WHERE id IN ({', '.join(['%s'] * len(ids))})", tuple(ids), conn)
+        return obtener_datos_bd(query + " ORDER BY fecha_creacion DESC")
+
+    def render_tasks(self, tasks):
         for widget in self.tasks_list_frame.winfo_children():
             widget.destroy()
 
-        query = "SELECT id, nombre, completada, importancia, notas, fecha_creacion FROM tareas ORDER BY fecha_creacion DESC"
-        tasks = obtener_datos_bd(query)
-
         if not tasks:
             ctk.CTkLabel(self.tasks_list_frame, text="No hay tareas en tu lista.", font=ctk.CTkFont(size=14, slant="italic"), text_color=COLOR_TEXT_MEDIUM).pack(pady=20)
             return
 
+        project_names = {project[0]: project[1] for project in self.projects}
         for task in tasks:
-            task_id, name, completed, importance, notes, creation_date = task
+            task_id, name, completed, importance, notes, creation_date, project_id = task
             
             task_item_frame = ctk.CTkFrame(self.tasks_list_frame, fg_color=COLOR_PRIMARY_DARK, border_color=COLOR_BORDER, border_width=1, corner_radius=8)
             task_item_frame.pack(fill="x", pady=5, padx=10)
@@ -551,6 +1303,10 @@ class App(ctk.CTk):
                 importance_canvas.grid(row=0, column=2, padx=(10,5), sticky="w")
                 
                 ctk.CTkLabel(left_section_frame, text=f"({importance})", font=ctk.CTkFont(size=11, slant="italic"), text_color=COLOR_TEXT_MEDIUM).grid(row=0, column=3, sticky="w")
+
+            # Trabajo al que pertenece la tarea, si el trabajo sigue existiendo
+            if project_names.get(project_id):
+                ctk.CTkLabel(left_section_frame, text=f"📁 {project_names[project_id]}", font=ctk.CTkFont(size=11), text_color=COLOR_ACCENT).grid(row=0, column=4, padx=(10,0), sticky="w")
             
             # Contenedor para botones (parte derecha)
             right_section_frame = ctk.CTkFrame(task_item_frame, fg_color="transparent")
@@ -558,7 +1314,7 @@ class App(ctk.CTk):
 
             detail_button = ctk.CTkButton(right_section_frame, text="Detalles", width=80, height=28, 
                                           fg_color=COLOR_ACCENT, hover_color="#4A90D9", text_color=COLOR_TEXT_LIGHT, 
-                                          command=lambda id=task_id, n=name, imp=importance, nt=notes, cd=creation_date: self.show_task_details_window(id, n, imp, nt, cd))
+                                          command=lambda id=task_id, n=name, imp=importance, nt=notes, cd=creation_date, pid=project_id: self.show_task_details_window(id, n, imp, nt, cd, pid))
             detail_button.pack(side="left", padx=(0,5))
 
             delete_button = ctk.CTkButton(right_section_frame, text="Eliminar", width=80, height=28, 
@@ -567,9 +1323,10 @@ class App(ctk.CTk):
             delete_button.pack(side="left")
 
     def toggle_task_completion(self, task_id):
-        query = "UPDATE tareas SET completada = NOT completada WHERE id = %s"
-        if ejecutar_consulta_bd(query, (task_id,)):
-            self.load_tasks()
+        # MySQL asigna de izquierda a derecha: en el IF, 'completada' ya tiene el valor nuevo
+        query = "UPDATE tareas SET completada = NOT completada, fecha_completada = IF(completada, %s, NULL) WHERE id = %s"
+        if ejecutar_consulta_bd(query, (datetime.now(), task_id)):
+            self.request_sync()
         else:
             self.set_notification("❌ Error al actualizar el estado de la tarea.", COLOR_ERROR)
 
@@ -577,15 +1334,15 @@ class App(ctk.CTk):
         query = "DELETE FROM tareas WHERE id = %s"
         if ejecutar_consulta_bd(query, (task_id,)):
             self.set_notification("🗑️ Tarea eliminada.", COLOR_TEXT_MEDIUM)
-            self.load_tasks()
+            self.request_sync()
         else:
             self.set_notification("❌ Error al eliminar la tarea.", COLOR_ERROR)
 
-    def show_task_details_window(self, task_id, name, importance, notes, creation_date):
+    def show_task_details_window(self, task_id, name, importance, notes, creation_date, project_id=None):
         """Muestra una ventana CTkToplevel con los detalles de la tarea."""
         details_window = ctk.CTkToplevel(self)
         details_window.title(f"Detalles de la Tarea: {name}")
-        details_window.geometry("500x400")
+        details_window.geometry("500x460")
         details_window.resizable(False, False)
         details_window.transient(self) # Hace que la ventana de detalles sea hija de la principal
         details_window.grab_set() # Bloquea interacción con la ventana principal
@@ -614,6 +1371,13 @@ class App(ctk.CTk):
         ctk.CTkLabel(frame, text="Importancia:", font=detail_title_font, text_color=COLOR_TEXT_LIGHT).pack(anchor="w", padx=20, pady=(10,0))
         ctk.CTkLabel(frame, text=importance, font=detail_font, text_color=COLOR_TEXT_MEDIUM, wraplength=400, justify="left").pack(anchor="w", padx=20)
         
+        ctk.CTkLabel(frame, text="Proyecto:", font=detail_title_font, text_color=COLOR_TEXT_LIGHT).pack(anchor="w", padx=20, pady=(10,0))
+        project_options = self._project_options()
+        project_menu = ctk.CTkOptionMenu(frame, values=list(project_options), command=lambda label, id=task_id: self.assign_task_project(id, label),
+                                         fg_color=COLOR_PRIMARY_DARK, button_color=COLOR_ACCENT, button_hover_color="#4A90D9", text_color=COLOR_TEXT_LIGHT)
+        project_menu.set(next((label for label, pid in project_options.items() if pid == project_id), SIN_PROYECTO))
+        project_menu.pack(anchor="w", padx=20)
+
         ctk.CTkLabel(frame, text="Fecha de Creación:", font=detail_title_font, text_color=COLOR_TEXT_LIGHT).pack(anchor="w", padx=20, pady=(10,0))
         ctk.CTkLabel(frame, text=creation_date.strftime("%d-%m-%Y %H:%M"), font=detail_font, text_color=COLOR_TEXT_MEDIUM, wraplength=400, justify="left").pack(anchor="w", padx=20)
 
@@ -630,6 +1394,14 @@ class App(ctk.CTk):
         # Manejar el cierre de la ventana
         details_window.protocol("WM_DELETE_WINDOW", lambda: self._on_details_close(details_window))
 
+    def assign_task_project(self, task_id, label):
+        query = "UPDATE tareas SET trabajo_id = %s WHERE id = %s"
+        if ejecutar_consulta_bd(query, (self._project_options().get(label), task_id)):
+            # El delta recalcula solo el progreso del trabajo anterior y del nuevo
+            self.request_sync()
+        else:
+            self.set_notification("❌ Error al cambiar el proyecto de la tarea.", COLOR_ERROR)
+
     def _on_details_close(self, window):
         """Libera el grab cuando la ventana de detalles se cierra."""
         window.grab_release()
@@ -653,23 +1425,26 @@ class App(ctk.CTk):
             self.set_notification(f"✅ Lista '{list_title}' creada.", COLOR_SUCCESS)
             self.list_title_entry.delete(0, "end")
             self.list_elements_entry.set_text("") # Usa set_text para manejar el placeholder
-            self.load_lists()
+            self.request_sync()
         else:
             self.set_notification("❌ Error al crear la lista. Revisa la consola.", COLOR_ERROR)
 
-    def load_lists(self):
+    def _fetch_lists(self, ids=None, conn=None):
+        query = "SELECT id, titulo, elementos, fecha_creacion FROM listas"
+        if ids:
+            return obtener_datos_bd(f"{query} WHERE id IN ({', '.join(['%s'] * len(ids))})", tuple(ids), conn)
+        return obtener_datos_bd(query + " ORDER BY fecha_creacion DESC")
+
+    def render_lists(self, lists):
         for widget in self.lists_scrollable_frame.winfo_children():
             widget.destroy()
 
-        query = "SELECT id, titulo, elementos FROM listas ORDER BY fecha_creacion DESC"
-        lists = obtener_datos_bd(query)
-
         if not lists:
             ctk.CTkLabel(self.lists_scrollable_frame, text="No hay listas creadas.", font=ctk.CTkFont(size=14, slant="italic"), text_color=COLOR_TEXT_MEDIUM).pack(pady=20)
             return
 
         for list_item in lists:
-            list_id, title, elements_text = list_item
+            list_id, title, elements_text, _ = list_item
             
             list_item_frame = ctk.CTkFrame(self.lists_scrollable_frame, fg_color=COLOR_PRIMARY_DARK, border_color=COLOR_BORDER, border_width=1, corner_radius=8)
             list_item_frame.pack(fill="x", pady=5, padx=10)
@@ -697,10 +1472,175 @@ class App(ctk.CTk):
         query = "DELETE FROM listas WHERE id = %s"
         if ejecutar_consulta_bd(query, (list_id,)):
             self.set_notification("🗑️ Lista eliminada.", COLOR_TEXT_MEDIUM)
-            self.load_lists()
+            self.request_sync()
         else:
             self.set_notification("❌ Error al eliminar la lista.", COLOR_ERROR)
 
+    # --- Métodos para Proyectos ---
+
+    def _project_options(self):
+        """Devuelve {etiqueta: trabajo_id} para los selectores de proyecto, con 'Sin proyecto' primero."""
+        options = {SIN_PROYECTO: None}
+        for project_id, name, _, _ in self.projects:
+            label = name if name not in options else f"{name} (#{project_id})"
+            options[label] = project_id
+        return options
+
+    def add_project(self):
+        project_name = self.project_name_entry.get().strip()
+        project_date = self.project_date_entry.get().strip()
+
+        if not project_name:
+            self.set_notification("❌ El nombre del proyecto no puede estar vacío.", COLOR_ERROR)
+            return
+
+        query = "INSERT INTO trabajos (nombre, fecha_hora, fecha_creacion) VALUES (%s, %s, %s)"
+        if ejecutar_consulta_bd(query, (project_name, project_date, datetime.now())):
+            self.set_notification(f"✅ Proyecto '{project_name}' creado.", COLOR_SUCCESS)
+            self.project_name_entry.delete(0, "end")
+            self.project_date_entry.delete(0, "end")
+            self.request_sync()
+        else:
+            self.set_notification("❌ Error al crear el proyecto. Revisa la consola.", COLOR_ERROR)
+
+    def _fetch_projects(self, ids=None, conn=None):
+        query = "SELECT id, nombre, fecha_hora, fecha_creacion FROM trabajos"
+        if ids:
+            return obtener_datos_bd(f"{query} WHERE id IN ({', '.join(['%s'] * len(ids))})", tuple(ids), conn)
+        return obtener_datos_bd(query + " ORDER BY fecha_creacion DESC")
+
+    def render_projects(self, projects):
+        # El selector de proyecto del panel principal refleja siempre los trabajos cargados
+        project_options = self._project_options()
+        self.task_project_menu.configure(values=list(project_options))
+        if self.current_task_project not in project_options.values():
+            self.current_task_project = None
+            self.task_project_menu.set(SIN_PROYECTO)
+
+        for widget in self.projects_scrollable_frame.winfo_children():
+            widget.destroy()
+
+        if not projects:
+            ctk.CTkLabel(self.projects_scrollable_frame, text="No hay proyectos creados.", font=ctk.CTkFont(size=14, slant="italic"), text_color=COLOR_TEXT_MEDIUM).pack(pady=20)
+            return
+
+        for project_id, name, due_date, _ in projects:
+            total, completed = self.project_progress.get(project_id, (0, 0))
+
+            project_item_frame = ctk.CTkFrame(self.projects_scrollable_frame, fg_color=COLOR_PRIMARY_DARK, border_color=COLOR_BORDER, border_width=1, corner_radius=8)
+            project_item_frame.pack(fill="x", pady=5, padx=10)
+
+            title_frame = ctk.CTkFrame(project_item_frame, fg_color="transparent")
+            title_frame.pack(fill="x", pady=(10,5), padx=10)
+            ctk.CTkLabel(title_frame, text=f"📁 {name}", font=ctk.CTkFont(size=16, weight="bold"), text_color=COLOR_TEXT_LIGHT, justify="left").pack(side="left", anchor="w")
+
+            delete_button = ctk.CTkButton(title_frame, text="Eliminar", width=80, height=28,
+                                          fg_color=COLOR_ERROR, hover_color="#D32F2F", text_color=COLOR_TEXT_LIGHT,
+                                          command=lambda id=project_id: self.delete_project(id))
+            delete_button.pack(side="right")
+
+            tasks_button = ctk.CTkButton(title_frame, text="Ver Tareas", width=80, height=28,
+                                         fg_color=COLOR_ACCENT, hover_color="#4A90D9", text_color=COLOR_TEXT_LIGHT,
+                                         command=lambda id=project_id, n=name: self.show_project_tasks_window(id, n))
+            tasks_button.pack(side="right", padx=(0,5))
+
+            if due_date:
+                ctk.CTkLabel(project_item_frame, text=f"  Entrega: {due_date}", font=ctk.CTkFont(size=12), text_color=COLOR_TEXT_MEDIUM, justify="left").pack(anchor="w", padx=20)
+
+            # Progreso: tareas completadas sobre el total (incluye las archivadas)
+            progress_frame = ctk.CTkFrame(project_item_frame, fg_color="transparent")
+            progress_frame.pack(fill="x", padx=20, pady=(5,10))
+            progress_bar = ctk.CTkProgressBar(progress_frame, progress_color=COLOR_SUCCESS, fg_color=COLOR_SECONDARY_DARK)
+            progress_bar.set(completed / total if total else 0)
+            progress_bar.pack(side="left", fill="x", expand=True, padx=(0,10))
+            ctk.CTkLabel(progress_frame, text=f"{completed}/{total} tareas", font=ctk.CTkFont(size=12), text_color=COLOR_TEXT_MEDIUM).pack(side="right")
+
+    def delete_project(self, project_id):
+        if eliminar_trabajo(project_id):
+            self.set_notification("🗑️ Proyecto eliminado.", COLOR_TEXT_MEDIUM)
+            self.request_sync()
+        else:
+            self.set_notification("❌ Error al eliminar el proyecto.", COLOR_ERROR)
+
+    def show_project_tasks_window(self, project_id, name):
+        """Muestra una ventana CTkToplevel con las tareas del proyecto."""
+        query = "SELECT nombre, completada, importancia FROM tareas WHERE trabajo_id = %s ORDER BY fecha_creacion DESC"
+        tasks = obtener_datos_bd(query, (project_id,))
+        if tasks is None:
+            self.set_notification("❌ No se pudieron cargar las tareas del proyecto.", COLOR_ERROR)
+            return
+
+        project_window = ctk.CTkToplevel(self)
+        project_window.title(f"Tareas del Proyecto: {name}")
+        project_window.geometry("500x400")
+        project_window.transient(self)
+        project_window.configure(fg_color=COLOR_PRIMARY_DARK)
+
+        ctk.CTkLabel(project_window, text=name, font=ctk.CTkFont(size=22, weight="bold"), text_color=COLOR_TEXT_LIGHT).pack(pady=(15,10))
+
+        tasks_frame = ctk.CTkScrollableFrame(project_window, fg_color=COLOR_SECONDARY_DARK, corner_radius=10)
+        tasks_frame.pack(fill="both", expand=True, padx=20, pady=(0,10))
+
+        if not tasks:
+            ctk.CTkLabel(tasks_frame, text="Este proyecto no tiene tareas activas.", font=ctk.CTkFont(size=14, slant="italic"), text_color=COLOR_TEXT_MEDIUM).pack(pady=20)
+        for task_name, completed, importance in tasks:
+            ctk.CTkLabel(tasks_frame, text=f"{'✅' if completed else '⬜'} {task_name} ({importance})", font=ctk.CTkFont(size=13),
+                         text_color=COLOR_SUCCESS if completed else COLOR_TEXT_LIGHT, justify="left", wraplength=420).pack(anchor="w", padx=10, pady=2)
+
+        ctk.CTkButton(project_window, text="Cerrar", command=project_window.destroy, fg_color=COLOR_ACCENT, hover_color="#4A90D9", text_color=COLOR_TEXT_LIGHT, height=35).pack(pady=(5,15))
+
+    # --- Métodos para el Archivo ---
+
+    def archive_now(self):
+        self.set_notification("⌛ Archivando elementos antiguos...", COLOR_TEXT_MEDIUM)
+        threading.Thread(target=self._archive_in_background).start()
+
+    def _archive_in_background(self):
+        resumen = archivar_elementos_antiguos()
+        self.after(0, lambda: self._display_archive_result(resumen))
+
+    def _display_archive_result(self, resumen):
+        total = sum(resumen.values())
+        self.set_notification(f"🗄️ {total} elementos movidos al archivo." if total else "No hay elementos que archivar.", COLOR_TEXT_MEDIUM)
+        self.load_archive()
+        self.request_sync()
+
+    def load_archive(self):
+        for widget in self.archive_scrollable_frame.winfo_children():
+            widget.destroy()
+
+        contadores = obtener_contadores_archivo()
+        tareas_total, tareas_completadas = contadores.get('tareas', (0, 0))
+        self.archive_counters_label.configure(text=f"Archivados: {tareas_total} tareas ({tareas_completadas} completadas), {contadores.get('recordatorios', (0, 0))[0]} recordatorios, {contadores.get('listas', (0, 0))[0]} listas")
+
+        entidad = self.archive_entity_menu.get().lower()
+        elementos = obtener_elementos_archivados(entidad)
+
+        if not elementos:
+            ctk.CTkLabel(self.archive_scrollable_frame, text="No hay elementos archivados.", font=ctk.CTkFont(size=14, slant="italic"), text_color=COLOR_TEXT_MEDIUM).pack(pady=20)
+            return
+
+        etiqueta = ENTIDADES_ARCHIVABLES[entidad]['etiqueta']
+        for archivo_id, id_original, datos, fecha_archivado in elementos:
+            archive_item_frame = ctk.CTkFrame(self.archive_scrollable_frame, fg_color=COLOR_PRIMARY_DARK, border_color=COLOR_BORDER, border_width=1, corner_radius=8)
+            archive_item_frame.pack(fill="x", pady=5, padx=10)
+
+            ctk.CTkLabel(archive_item_frame, text=datos.get(etiqueta) or f"#{id_original}", font=ctk.CTkFont(size=14, weight="bold"), text_color=COLOR_TEXT_LIGHT, justify="left", wraplength=400).pack(side="left", anchor="w", padx=10, pady=5)
+            ctk.CTkLabel(archive_item_frame, text=f"Archivado: {fecha_archivado.strftime('%d-%m-%Y')}", font=ctk.CTkFont(size=11, slant="italic"), text_color=COLOR_TEXT_MEDIUM).pack(side="left", padx=10)
+
+            restore_button = ctk.CTkButton(archive_item_frame, text="Restaurar", width=80, height=28,
+                                           fg_color=COLOR_SUCCESS, hover_color="#45A049", text_color=COLOR_TEXT_LIGHT,
+                                           command=lambda id=archivo_id: self.restore_archived_item(id))
+            restore_button.pack(side="right", padx=10, pady=5)
+
+    def restore_archived_item(self, archivo_id):
+        if restaurar_elemento_archivado(archivo_id):
+            self.set_notification("♻️ Elemento restaurado desde el archivo.", COLOR_SUCCESS)
+            self.load_archive()
+            self.request_sync()
+        else:
+            self.set_notification("❌ Error al restaurar el elemento. Revisa la consola.", COLOR_ERROR)
+
     # --- Otros métodos ---
 
     def get_study_topic(self):
@@ -709,7 +1649,12 @@ class App(ctk.CTk):
 
     def _fetch_study_topic_in_background(self):
         tema = obtener_tema_ia()
-        self.after(0, lambda: self.study_topic_label.configure(text=f"✨ Tema del día: {tema}", text_color=COLOR_ACCENT))
+        self.after(0, lambda: self._display_study_topic(tema))
+
+    def _display_study_topic(self, tema):
+        self.study_topic = tema
+        self.study_topic_label.configure(text=f"✨ Tema del día: {tema}", text_color=COLOR_ACCENT)
+        self.save_snapshot()
 
     def analyze_with_ai(self):
         self.ai_analysis_text.delete("1.0", "end")
@@ -736,14 +1681,7 @@ class App(ctk.CTk):
 # --- 3. INICIO DE LA APLICACIÓN ---
 
 if __name__ == "__main__":
-    if conectar_bd() is None:
-        print("\n--- ADVERTENCIA CRÍTICA ---")
-        print("No se pudo establecer conexión con la base de datos MySQL.")
-        print(f"Por favor, verifica la configuración en DB_CONFIG (host, user, password, database).")
-        print(f"Asegúrate de que el servidor MySQL esté corriendo y la base de datos '{DB_CONFIG.get('database')}' exista.")
-        print("El programa continuará, pero las funcionalidades de tareas y listas no funcionarán.")
-        print("----------------------------\n")
-        # En una aplicación real, aquí podrías cerrar la app o deshabilitar funcionalidades de BD.
-
+    # La conexión a la base de datos se comprueba en segundo plano (App._sync_in_background)
+    # para que la ventana se muestre con la instantánea local sin esperar a MySQL.
     app = App()
     app.mainloop()
\ No newline at end of file
@@ -17,6 +17,82 @@ USE `asistente_db`;
 /*!40101 SET @OLD_SQL_MODE=@@SQL_MODE, SQL_MODE='NO_AUTO_VALUE_ON_ZERO' */;
 /*!40111 SET @OLD_SQL_NOTES=@@SQL_NOTES, SQL_NOTES=0 */;
 
+--
+-- Table structure for table `archivo`
+--
+
+DROP TABLE IF EXISTS `archivo`;
+/*!40101 SET @saved_cs_client     = @@character_set_client */;
+/*!50503 SET character_set_client = utf8mb4 */;
+CREATE TABLE `archivo` (
+  `id` int NOT NULL AUTO_INCREMENT,
+  `entidad` varchar(20) NOT NULL,
+  `id_original` int NOT NULL,
+  `datos` json NOT NULL,
+  `fecha_archivado` datetime NOT NULL,
+  `trabajo_id` int DEFAULT NULL,
+  PRIMARY KEY (`id`),
+  KEY `idx_archivo_entidad_fecha` (`entidad`,`fecha_archivado`),
+  KEY `idx_archivo_trabajo` (`trabajo_id`,`entidad`)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_0900_ai_ci;
+/*!40101 SET character_set_client = @saved_cs_client */;
+
+--
+-- Dumping data for table `archivo`
+--
+
+LOCK TABLES `archivo` WRITE;
+/*!40000 ALTER TABLE `archivo` DISABLE KEYS */;
+/*!40000 ALTER TABLE `archivo` ENABLE KEYS */;
+UNLOCK TABLES;
+
+--
+-- Table structure for table `contadores_archivo`
+--
+
+DROP TABLE IF EXISTS `contadores_archivo`;
+/*!40101 SET @saved_cs_client     = @@character_set_client */;
+/*!50503 SET character_set_client = utf8mb4 */;
+CREATE TABLE `contadores_archivo` (
+  `entidad` varchar(20) NOT NULL,
+  `total` int NOT NULL DEFAULT '0',
+  `completadas` int NOT NULL DEFAULT '0',
+  PRIMARY KEY (`entidad`)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_0900_ai_ci;
+/*!40101 SET character_set_client = @saved_cs_client */;
+
+--
+-- Dumping data for table `contadores_archivo`
+--
+
+LOCK TABLES `contadores_archivo` WRITE;
+/*!40000 ALTER TABLE `contadores_archivo` DISABLE KEYS */;
+/*!40000 ALTER TABLE `contadores_archivo` ENABLE KEYS */;
+UNLOCK TABLES;
+
+--
+-- Table structure for table `elementos_fijados`
+--
+
+DROP TABLE IF EXISTS `elementos_fijados`;
+/*!40101 SET @saved_cs_client     = @@character_set_client */;
+/*!50503 SET character_set_client = utf8mb4 */;
+CREATE TABLE `elementos_fijados` (
+  `entidad` varchar(20) NOT NULL,
+  `entidad_id` int NOT NULL,
+  PRIMARY KEY (`entidad`,`entidad_id`)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_0900_ai_ci;
+/*!40101 SET character_set_client = @saved_cs_client */;
+
+--
+-- Dumping data for table `elementos_fijados`
+--
+
+LOCK TABLES `elementos_fijados` WRITE;
+/*!40000 ALTER TABLE `elementos_fijados` DISABLE KEYS */;
+/*!40000 ALTER TABLE `elementos_fijados` ENABLE KEYS */;
+UNLOCK TABLES;
+
 --
 -- Table structure for table `listas`
 --
@@ -29,7 +105,8 @@ CREATE TABLE `listas` (
   `titulo` varchar(255) NOT NULL,
   `elementos` text NOT NULL,
   `fecha_creacion` datetime NOT NULL,
-  PRIMARY KEY (`id`)
+  PRIMARY KEY (`id`),
+  KEY `idx_listas_fecha` (`fecha_creacion`)
 ) ENGINE=InnoDB AUTO_INCREMENT=3 DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_0900_ai_ci;
 /*!40101 SET character_set_client = @saved_cs_client */;
 
@@ -41,6 +118,51 @@ LOCK TABLES `listas` WRITE;
 /*!40000 ALTER TABLE `listas` DISABLE KEYS */;
 /*!40000 ALTER TABLE `listas` ENABLE KEYS */;
 UNLOCK TABLES;
+/*!50003 SET @saved_cs_client      = @@character_set_client */ ;
+/*!50003 SET @saved_cs_results     = @@character_set_results */ ;
+/*!50003 SET @saved_col_connection = @@collation_connection */ ;
+/*!50003 SET character_set_client  = utf8mb4 */ ;
+/*!50003 SET character_set_results = utf8mb4 */ ;
+/*!50003 SET collation_connection  = utf8mb4_0900_ai_ci */ ;
+DELIMITER ;;
+/*!50003 CREATE*/ /*!50003 TRIGGER `trg_listas_insert_registro` AFTER INSERT ON `listas` FOR EACH ROW BEGIN
+UPDATE secuencia_cambios SET seq = seq + 1 WHERE id = 1;
+INSERT INTO registro_cambios (seq, entidad, entidad_id, operacion) SELECT seq, 'listas', NEW.id, 'I' FROM secuencia_cambios WHERE id = 1;
+END */;;
+DELIMITER ;
+/*!50003 SET character_set_client  = @saved_cs_client */ ;
+/*!50003 SET character_set_results = @saved_cs_results */ ;
+/*!50003 SET collation_connection  = @saved_col_connection */ ;
+/*!50003 SET @saved_cs_client      = @@character_set_client */ ;
+/*!50003 SET @saved_cs_results     = @@character_set_results */ ;
+/*!50003 SET @saved_col_connection = @@collation_connection */ ;
+/*!50003 SET character_set_client  = utf8mb4 */ ;
+/*!50003 SET character_set_results = utf8mb4 */ ;
+/*!50003 SET collation_connection  = utf8mb4_0900_ai_ci */ ;
+DELIMITER ;;
+/*!50003 CREATE*/ /*!50003 TRIGGER `trg_listas_update_registro` AFTER UPDATE ON `listas` FOR EACH ROW BEGIN
+UPDATE secuencia_cambios SET seq = seq + 1 WHERE id = 1;
+INSERT INTO registro_cambios (seq, entidad, entidad_id, operacion) SELECT seq, 'listas', NEW.id, 'U' FROM secuencia_cambios WHERE id = 1;
+END */;;
+DELIMITER ;
+/*!50003 SET character_set_client  = @saved_cs_client */ ;
+/*!50003 SET character_set_results = @saved_cs_results */ ;
+/*!50003 SET collation_connection  = @saved_col_connection */ ;
+/*!50003 SET @saved_cs_client      = @@character_set_client */ ;
+/*!50003 SET @saved_cs_results     = @@character_set_results */ ;
+/*!50003 SET @saved_col_connection = @@collation_connection */ ;
+/*!50003 SET character_set_client  = utf8mb4 */ ;
+/*!50003 SET character_set_results = utf8mb4 */ ;
+/*!50003 SET collation_connection  = utf8mb4_0900_ai_ci */ ;
+DELIMITER ;;
+/*!50003 CREATE*/ /*!50003 TRIGGER `trg_listas_delete_registro` AFTER DELETE ON `listas` FOR EACH ROW BEGIN
+UPDATE secuencia_cambios SET seq = seq + 1 WHERE id = 1;
+INSERT INTO registro_cambios (seq, entidad, entidad_id, operacion) SELECT seq, 'listas', OLD.id, 'D' FROM secuencia_cambios WHERE id = 1;
+END */;;
+DELIMITER ;
+/*!50003 SET character_set_client  = @saved_cs_client */ ;
+/*!50003 SET character_set_results = @saved_cs_results */ ;
+/*!50003 SET collation_connection  = @saved_col_connection */ ;
 
 --
 -- Table structure for table `recordatorios`
@@ -53,7 +175,8 @@ CREATE TABLE `recordatorios` (
   `id` int NOT NULL AUTO_INCREMENT,
   `texto` varchar(255) NOT NULL,
   `fecha_creacion` datetime NOT NULL,
-  PRIMARY KEY (`id`)
+  PRIMARY KEY (`id`),
+  KEY `idx_recordatorios_fecha` (`fecha_creacion`)
 ) ENGINE=InnoDB AUTO_INCREMENT=4 DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_0900_ai_ci;
 /*!40101 SET character_set_client = @saved_cs_client */;
 
@@ -66,6 +189,101 @@ LOCK TABLES `recordatorios` WRITE;
 INSERT INTO `recordatorios` VALUES (1,'Creacion de base de datos','2025-09-03 15:56:04'),(2,'hacer movimientos','2025-09-03 15:59:03'),(3,'mejorar aplicacacion','2025-09-04 10:31:36');
 /*!40000 ALTER TABLE `recordatorios` ENABLE KEYS */;
 UNLOCK TABLES;
+/*!50003 SET @saved_cs_client      = @@character_set_client */ ;
+/*!50003 SET @saved_cs_results     = @@character_set_results */ ;
+/*!50003 SET @saved_col_connection = @@collation_connection */ ;
+/*!50003 SET character_set_client  = utf8mb4 */ ;
+/*!50003 SET character_set_results = utf8mb4 */ ;
+/*!50003 SET collation_connection  = utf8mb4_0900_ai_ci */ ;
+DELIMITER ;;
+/*!50003 CREATE*/ /*!50003 TRIGGER `trg_recordatorios_insert_registro` AFTER INSERT ON `recordatorios` FOR EACH ROW BEGIN
+UPDATE secuencia_cambios SET seq = seq + 1 WHERE id = 1;
+INSERT INTO registro_cambios (seq, entidad, entidad_id, operacion) SELECT seq, 'recordatorios', NEW.id, 'I' FROM secuencia_cambios WHERE id = 1;
+END */;;
+DELIMITER ;
+/*!50003 SET character_set_client  = @saved_cs_client */ ;
+/*!50003 SET character_set_results = @saved_cs_results */ ;
+/*!50003 SET collation_connection  = @saved_col_connection */ ;
+/*!50003 SET @saved_cs_client      = @@character_set_client */ ;
+/*!50003 SET @saved_cs_results     = @@character_set_results */ ;
+/*!50003 SET @saved_col_connection = @@collation_connection */ ;
+/*!50003 SET character_set_client  = utf8mb4 */ ;
+/*!50003 SET character_set_results = utf8mb4 */ ;
+/*!50003 SET collation_connection  = utf8mb4_0900_ai_ci */ ;
+DELIMITER ;;
+/*!50003 CREATE*/ /*!50003 TRIGGER `trg_recordatorios_update_registro` AFTER UPDATE ON `recordatorios` FOR EACH ROW BEGIN
+UPDATE secuencia_cambios SET seq = seq + 1 WHERE id = 1;
+INSERT INTO registro_cambios (seq, entidad, entidad_id, operacion) SELECT seq, 'recordatorios', NEW.id, 'U' FROM secuencia_cambios WHERE id = 1;
+END */;;
+DELIMITER ;
+/*!50003 SET character_set_client  = @saved_cs_client */ ;
+/*!50003 SET character_set_results = @saved_cs_results */ ;
+/*!50003 SET collation_connection  = @saved_col_connection */ ;
+/*!50003 SET @saved_cs_client      = @@character_set_client */ ;
+/*!50003 SET @saved_cs_results     = @@character_set_results */ ;
+/*!50003 SET @saved_col_connection = @@collation_connection */ ;
+/*!50003 SET character_set_client  = utf8mb4 */ ;
+/*!50003 SET character_set_results = utf8mb4 */ ;
+/*!50003 SET collation_connection  = utf8mb4_0900_ai_ci */ ;
+DELIMITER ;;
+/*!50003 CREATE*/ /*!50003 TRIGGER `trg_recordatorios_delete_registro` AFTER DELETE ON `recordatorios` FOR EACH ROW BEGIN
+UPDATE secuencia_cambios SET seq = seq + 1 WHERE id = 1;
+INSERT INTO registro_cambios (seq, entidad, entidad_id, operacion) SELECT seq, 'recordatorios', OLD.id, 'D' FROM secuencia_cambios WHERE id = 1;
+END */;;
+DELIMITER ;
+/*!50003 SET character_set_client  = @saved_cs_client */ ;
+/*!50003 SET character_set_results = @saved_cs_results */ ;
+/*!50003 SET collation_connection  = @saved_col_connection */ ;
+
+--
+-- Table structure for table `registro_cambios`
+--
+
+DROP TABLE IF EXISTS `registro_cambios`;
+/*!40101 SET @saved_cs_client     = @@character_set_client */;
+/*!50503 SET character_set_client = utf8mb4 */;
+CREATE TABLE `registro_cambios` (
+  `seq` bigint NOT NULL,
+  `entidad` varchar(20) NOT NULL,
+  `entidad_id` int NOT NULL,
+  `operacion` char(1) NOT NULL,
+  `fecha` datetime NOT NULL DEFAULT CURRENT_TIMESTAMP,
+  PRIMARY KEY (`seq`)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_0900_ai_ci;
+/*!40101 SET character_set_client = @saved_cs_client */;
+
+--
+-- Dumping data for table `registro_cambios`
+--
+
+LOCK TABLES `registro_cambios` WRITE;
+/*!40000 ALTER TABLE `registro_cambios` DISABLE KEYS */;
+/*!40000 ALTER TABLE `registro_cambios` ENABLE KEYS */;
+UNLOCK TABLES;
+
+--
+-- Table structure for table `secuencia_cambios`
+--
+
+DROP TABLE IF EXISTS `secuencia_cambios`;
+/*!40101 SET @saved_cs_client     = @@character_set_client */;
+/*!50503 SET character_set_client = utf8mb4 */;
+CREATE TABLE `secuencia_cambios` (
+  `id` tinyint NOT NULL,
+  `seq` bigint NOT NULL DEFAULT '0',
+  PRIMARY KEY (`id`)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_0900_ai_ci;
+/*!40101 SET character_set_client = @saved_cs_client */;
+
+--
+-- Dumping data for table `secuencia_cambios`
+--
+
+LOCK TABLES `secuencia_cambios` WRITE;
+/*!40000 ALTER TABLE `secuencia_cambios` DISABLE KEYS */;
+INSERT INTO `secuencia_cambios` VALUES (1,0);
+/*!40000 ALTER TABLE `secuencia_cambios` ENABLE KEYS */;
+UNLOCK TABLES;
 
 --
 -- Table structure for table `tareas`
@@ -81,7 +299,12 @@ CREATE TABLE `tareas` (
   `completada` tinyint(1) DEFAULT '0',
   `importancia` varchar(50) DEFAULT 'Media',
   `notas` text,
-  PRIMARY KEY (`id`)
+  `trabajo_id` int DEFAULT NULL,
+  `fecha_completada` datetime DEFAULT NULL,
+  PRIMARY KEY (`id`),
+  KEY `idx_tareas_trabajo` (`trabajo_id`,`completada`),
+  KEY `idx_tareas_archivado` (`completada`,`fecha_completada`),
+  CONSTRAINT `fk_tareas_trabajo` FOREIGN KEY (`trabajo_id`) REFERENCES `trabajos` (`id`) ON DELETE SET NULL
 ) ENGINE=InnoDB AUTO_INCREMENT=9 DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_0900_ai_ci;
 /*!40101 SET character_set_client = @saved_cs_client */;
 
@@ -91,9 +314,54 @@ CREATE TABLE `tareas` (
 
 LOCK TABLES `tareas` WRITE;
 /*!40000 ALTER TABLE `tareas` DISABLE KEYS */;
-INSERT INTO `tareas` VALUES (7,'Trabajo de universidad','2025-11-05 13:59:13',1,'Media',''),(8,'Aprender Python','2025-11-05 14:08:43',1,'Media','');
+INSERT INTO `tareas` VALUES (7,'Trabajo de universidad','2025-11-05 13:59:13',1,'Media','',NULL,'2025-11-05 13:59:13'),(8,'Aprender Python','2025-11-05 14:08:43',1,'Media','',NULL,'2025-11-05 14:08:43');
 /*!40000 ALTER TABLE `tareas` ENABLE KEYS */;
 UNLOCK TABLES;
+/*!50003 SET @saved_cs_client      = @@character_set_client */ ;
+/*!50003 SET @saved_cs_results     = @@character_set_results */ ;
+/*!50003 SET @saved_col_connection = @@collation_connection */ ;
+/*!50003 SET character_set_client  = utf8mb4 */ ;
+/*!50003 SET character_set_results = utf8mb4 */ ;
+/*!50003 SET collation_connection  = utf8mb4_0900_ai_ci */ ;
+DELIMITER ;;
+/*!50003 CREATE*/ /*!50003 TRIGGER `trg_tareas_insert_registro` AFTER INSERT ON `tareas` FOR EACH ROW BEGIN
+UPDATE secuencia_cambios SET seq = seq + 1 WHERE id = 1;
+INSERT INTO registro_cambios (seq, entidad, entidad_id, operacion) SELECT seq, 'tareas', NEW.id, 'I' FROM secuencia_cambios WHERE id = 1;
+END */;;
+DELIMITER ;
+/*!50003 SET character_set_client  = @saved_cs_client */ ;
+/*!50003 SET character_set_results = @saved_cs_results */ ;
+/*!50003 SET collation_connection  = @saved_col_connection */ ;
+/*!50003 SET @saved_cs_client      = @@character_set_client */ ;
+/*!50003 SET @saved_cs_results     = @@character_set_results */ ;
+/*!50003 SET @saved_col_connection = @@collation_connection */ ;
+/*!50003 SET character_set_client  = utf8mb4 */ ;
+/*!50003 SET character_set_results = utf8mb4 */ ;
+/*!50003 SET collation_connection  = utf8mb4_0900_ai_ci */ ;
+DELIMITER ;;
+/*!50003 CREATE*/ /*!50003 TRIGGER `trg_tareas_update_registro` AFTER UPDATE ON `tareas` FOR EACH ROW BEGIN
+UPDATE secuencia_cambios SET seq = seq + 1 WHERE id = 1;
+INSERT INTO registro_cambios (seq, entidad, entidad_id, operacion) SELECT seq, 'tareas', NEW.id, 'U' FROM secuencia_cambios WHERE id = 1;
+END */;;
+DELIMITER ;
+/*!50003 SET character_set_client  = @saved_cs_client */ ;
+/*!50003 SET character_set_results = @saved_cs_results */ ;
+/*!50003 SET collation_connection  = @saved_col_connection */ ;
+/*!50003 SET @saved_cs_client      = @@character_set_client */ ;
+/*!50003 SET @saved_cs_results     = @@character_set_results */ ;
+/*!50003 SET @saved_col_connection = @@collation_connection */ ;
+/*!50003 SET character_set_client  = utf8mb4 */ ;
+/*!50003 SET character_set_results = utf8mb4 */ ;
+/*!50003 SET collation_connection  = utf8mb4_0900_ai_ci */ ;
+DELIMITER ;;
+/*!50003 CREATE*/ /*!50003 TRIGGER `trg_tareas_delete_registro` AFTER DELETE ON `tareas` FOR EACH ROW BEGIN
+UPDATE secuencia_cambios SET seq = seq + 1 WHERE id = 1;
+INSERT INTO registro_cambios (seq, entidad, entidad_id, operacion) SELECT seq, 'tareas', OLD.id, 'D' FROM secuencia_cambios WHERE id = 1;
+END */;;
+DELIMITER ;
+/*!50003 SET character_set_client  = @saved_cs_client */ ;
+/*!50003 SET character_set_results = @saved_cs_results */ ;
+/*!50003 SET collation_connection  = @saved_col_connection */ ;
 
 --
 -- Table structure for table `trabajos`
@@ -120,6 +388,53 @@ LOCK TABLES `trabajos` WRITE;
 INSERT INTO `trabajos` VALUES (1,'Importancias de programar','04/09/2025 15:05','2025-09-03 16:20:06');
 /*!40000 ALTER TABLE `trabajos` ENABLE KEYS */;
 UNLOCK TABLES;
+/*!50003 SET @saved_cs_client      = @@character_set_client */ ;
+/*!50003 SET @saved_cs_results     = @@character_set_results */ ;
+/*!50003 SET @saved_col_connection = @@collation_connection */ ;
+/*!50003 SET character_set_client  = utf8mb4 */ ;
+/*!50003 SET character_set_results = utf8mb4 */ ;
+/*!50003 SET collation_connection  = utf8mb4_0900_ai_ci */ ;
+DELIMITER ;;
+/*!50003 CREATE*/ /*!50003 TRIGGER `trg_trabajos_insert_registro` AFTER INSERT ON `trabajos` FOR EACH ROW BEGIN
+UPDATE secuencia_cambios SET seq = seq + 1 WHERE id = 1;
+INSERT INTO registro_cambios (seq, entidad, entidad_id, operacion) SELECT seq, 'trabajos', NEW.id, 'I' FROM secuencia_cambios WHERE id = 1;
+END */;;
+DELIMITER ;
+/*!50003 SET character_set_client  = @saved_cs_client */ ;
+/*!50003 SET character_set_results = @saved_cs_results */ ;
+/*!50003 SET collation_connection  = @saved_col_connection */ ;
+/*!50003 SET @saved_cs_client      = @@character_set_client */ ;
+/*!50003 SET @saved_cs_results     = @@character_set_results */ ;
+/*!50003 SET @saved_col_connection = @@collation_connection */ ;
+/*!50003 SET character_set_client  = utf8mb4 */ ;
+/*!50003 SET character_set_results = utf8mb4 */ ;
+/*!50003 SET collation_connection  = utf8mb4_0900_ai_ci */ ;
+DELIMITER ;;
+/*!50003 CREATE*/ /*!50003 TRIGGER `trg_trabajos_update_registro` AFTER UPDATE ON `trabajos` FOR EACH ROW BEGIN
+UPDATE secuencia_cambios SET seq = seq + 1 WHERE id = 1;
+INSERT INTO registro_cambios (seq, entidad, entidad_id, operacion) SELECT seq, 'trabajos', NEW.id, 'U' FROM secuencia_cambios WHERE id = 1;
+END */;;
+DELIMITER ;
+/*!50003 SET character_set_client  = @saved_cs_client */ ;
+/*!50003 SET character_set_results = @saved_cs_results */ ;
+/*!50003 SET collation_connection  = @saved_col_connection */ ;
+/*!50003 SET @saved_cs_client      = @@character_set_client */ ;
+/*!50003 SET @saved_cs_results     = @@character_set_results */ ;
+/*!50003 SET @saved_col_connection = @@collation_connection */ ;
+/*!50003 SET character_set_client  = utf8mb4 */ ;
+/*!50003 SET character_set_results = utf8mb4 */ ;
+/*!50003 SET collation_connection  = utf8mb4_0900_ai_ci */ ;
+DELIMITER ;;
+/*!50003 CREATE*/ /*!50003 TRIGGER `trg_trabajos_delete_registro` AFTER DELETE ON `trabajos` FOR EACH ROW BEGIN
+UPDATE secuencia_cambios SET seq = seq + 1 WHERE id = 1;
+INSERT INTO registro_cambios (seq, entidad, entidad_id, operacion) SELECT seq, 'trabajos', OLD.id, 'D' FROM secuencia_cambios WHERE id = 1;
+END */;;
+DELIMITER ;
+/*!50003 SET character_set_client  = @saved_cs_client */ ;
+/*!50003 SET character_set_results = @saved_cs_results */ ;
+/*!50003 SET collation_connection  = @saved_col_connection */ ;
+
+
 /*!40103 SET TIME_ZONE=@OLD_TIME_ZONE */;
 
 /*!40101 SET SQL_MODE=@OLD_SQL_MODE */;